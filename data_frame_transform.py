@@ -4,12 +4,14 @@ Imports the DataFrameInfo class and key libraries for data analysis.
 Modules:
 --------
 - DataFrameInfo: Custom class to extract information from pandas DataFrames.
+- array_quantiles: finds exact quantiles of an array with a single partial sort.
 - pandas (pd): Essential library for data manipulation and analysis.
 - numpy (np): Library for numerical operations, often used alongside pandas for data handling.
 - scipy.stats: includes Box-Cox transformation for normalising data.
 '''
 
 from data_frame_info import DataFrameInfo
+from quantile_engine import array_quantiles
 import pandas as pd
 import numpy as np
 from scipy.stats import boxcox
@@ -144,6 +146,8 @@ class DataFrameTransform:
     def remove_outliers(self, columns=None, threshold=1.5):
         """
         Removes outliers from the specified columns in the DataFrame using the IQR method.
+        Each column's bounds are found from the rows kept by the columns before it; the
+        rows are tracked with a boolean mask and the DataFrame is only filtered once.
         
         Parameters:
         ----------
@@ -162,15 +166,17 @@ class DataFrameTransform:
         else:
             columns = [col for col in columns if col in self.df.select_dtypes(include='number').columns]
 
+        keep = np.ones(len(self.df), dtype=bool)
         for col in columns:
-            Q1 = self.df[col].quantile(0.25)
-            Q3 = self.df[col].quantile(0.75)
+            values = self.df[col].to_numpy(dtype=float, na_value=np.nan)
+            Q1, Q3 = array_quantiles(values[keep], [0.25, 0.75])
             IQR = Q3 -Q1
             lower_bound = Q1 - threshold * IQR
             upper_bound = Q3 + threshold * IQR
 
-            self.df = self.df[(self.df[col] >= lower_bound) & (self.df[col] <= upper_bound)]
+            keep &= (values >= lower_bound) & (values <= upper_bound)
 
+        self.df = self.df[keep]
         return self.df
 
 
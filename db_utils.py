@@ -30,10 +30,13 @@ class RDSDatabaseConnector:
 
     Methods:
     -------
+    database_url()
+        returns the SQLAlchemy URL of the database to connect to.
+
     initialise_engine()
         initialises a SQLAchemy engine. 
 
-    extract_data()
+    extract_data(chunksize)
         extracts 'loan_payments' from RDS database.
 
     save_data_csv(loan_payments_df)
@@ -68,26 +71,40 @@ class RDSDatabaseConnector:
         self.engine = None
 
 
+    def database_url(self):
+        '''
+        This method returns the SQLAlchemy URL built from the credentials given.
+        Subclasses override it to point the connector at a different database.
+        '''
+
+        return f'postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}'
+
+
     def initialise_engine(self):
         '''
         This method initialises a SQLAlchemy engine using the credentials given. 
         '''
 
-        connection = (f'postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}')
-        self.engine = create_engine(connection)
+        self.engine = create_engine(self.database_url())
 
 
-    def extract_data(self):
+    def extract_data(self, chunksize=None):
         '''
-        This method extracts the dataset 'loan_payments' from the AWS RDS database 
-        and returns it as a pandas DataFrame.
+        This method extracts the dataset 'loan_payments' from the database at
+        database_url() (the AWS RDS database, or a local one for LocalDatabaseConnector).
+
+        Parameters:
+        ----------
+        chunksize: int, optional
+            If given, the table is read in chunks of this many rows.
 
         Returns:
         -------
-        returns a pandas DataFrame of the 'loan_payments' table from the RDS database.
+        returns a pandas DataFrame of the 'loan_payments' table, or an iterator of
+        DataFrames with up to chunksize rows each if chunksize is given.
         '''
 
-        extracted_df = pd.read_sql_table('loan_payments', self.engine)
+        extracted_df = pd.read_sql_table('loan_payments', self.engine, chunksize=chunksize)
         return extracted_df
 
 
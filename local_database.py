@@ -0,0 +1,312 @@
+'''
+Imports needed for building a local stand-in for the AWS RDS database, filling it
+with synthetic 'loan_payments' data and timing the extraction from it.
+
+Modules:
+--------
+- io: in-memory CSV buffer used for COPY loads through psycopg2.
+- time: used to time the extraction benchmark.
+- numpy (np): used to generate the synthetic data.
+- pandas (pd): used to hold each batch of synthetic data.
+- sqlalchemy: used to define the 'loan_payments' table and insert the data.
+- make_url: used to check that the database being (re)loaded is a local one.
+- RDSDatabaseConnector: the connector the local stand-in is built on.
+'''
+
+import io
+import time
+import numpy as np
+import pandas as pd
+from sqlalchemy import Column, Float, Integer, MetaData, Table, Text
+from sqlalchemy.engine import make_url
+from db_utils import RDSDatabaseConnector
+
+
+LOAN_PAYMENTS_COLUMNS = [
+    'id', 'member_id', 'loan_amount', 'funded_amount', 'funded_amount_inv', 'term',
+    'int_rate', 'instalment', 'grade', 'sub_grade', 'employment_length', 'home_ownership',
+    'annual_inc', 'verification_status', 'issue_date', 'loan_status', 'payment_plan',
+    'purpose', 'dti', 'delinq_2yrs', 'earliest_credit_line', 'inq_last_6mths',
+    'mths_since_last_delinq', 'mths_since_last_record', 'open_accounts', 'total_accounts',
+    'out_prncp', 'out_prncp_inv', 'total_payment', 'total_payment_inv', 'total_rec_prncp',
+    'total_rec_int', 'total_rec_late_fee', 'recoveries', 'collection_recovery_fee',
+    'last_payment_date', 'last_payment_amount', 'next_payment_date', 'last_credit_pull_date',
+    'collections_12_mths_ex_med', 'mths_since_last_major_derog', 'policy_code',
+    'application_type'
+]
+
+LOCAL_HOSTS = {None, '', 'localhost', '127.0.0.1', '::1'}
+
+# Null percentages of the real dataset, so the synthetic data needs the same cleaning.
+NULL_PERCENTAGES = {
+    'funded_amount': 5.5, 'term': 8.8, 'int_rate': 9.5, 'employment_length': 3.9,
+    'mths_since_last_delinq': 57.2, 'mths_since_last_record': 88.6,
+    'last_payment_date': 0.1, 'next_payment_date': 60.1, 'last_credit_pull_date': 0.01,
+    'collections_12_mths_ex_med': 0.1, 'mths_since_last_major_derog': 86.2
+}
+
+
+def loan_payments_table(metadata):
+    '''
+    This function defines the 'loan_payments' table with the same columns as the
+    table in the AWS RDS database.
+
+    Parameters:
+    ----------
+    metadata: sqlalchemy.MetaData
+        The MetaData the table is added to.
+
+    Returns:
+    -------
+    returns the sqlalchemy Table for 'loan_payments'.
+    '''
+
+    integer_columns = ['member_id', 'loan_amount', 'delinq_2yrs', 'inq_last_6mths',
+                       'open_accounts', 'total_accounts', 'policy_code']
+    text_columns = ['term', 'grade', 'sub_grade', 'employment_length', 'home_ownership',
+                    'verification_status', 'issue_date', 'loan_status', 'payment_plan',
+                    'purpose', 'earliest_credit_line', 'last_payment_date',
+                    'next_payment_date', 'last_credit_pull_date', 'application_type']
+
+    columns = [Column('id', Integer, primary_key=True)]
+    for col in LOAN_PAYMENTS_COLUMNS[1:]:
+        if col in integer_columns:
+            columns.append(Column(col, Integer))
+        elif col in text_columns:
+            columns.append(Column(col, Text))
+        else:
+            columns.append(Column(col, Float))
+    return Table('loan_payments', metadata, *columns)
+
+
+def generate_loan_payments(n_rows, start_id=0, seed=None):
+    '''
+    This function generates a DataFrame of synthetic loans with the 'loan_payments' columns.
+
+    Parameters:
+    ----------
+    n_rows: int
+        The number of rows to generate.
+    start_id: int, default=0
+        The id of the first row, so batches can be generated with unique ids.
+    seed: int, optional
+        Seed for the random number generator, for reproducible data.
+
+    Returns:
+    -------
+    returns a pandas DataFrame of synthetic 'loan_payments' data.
+    '''
+
+    rng = np.random.default_rng(seed)
+    months = pd.date_range('2005-01-01', '2022-01-01', freq='MS').strftime('%b-%Y').to_numpy()
+    grade_index = rng.choice(7, n_rows, p=[0.25, 0.3, 0.2, 0.13, 0.07, 0.04, 0.01])
+    grades = np.array(list('ABCDEFG'))[grade_index]
+    loan_amount = rng.integers(10, 700, n_rows) * 50
+    int_rate = np.round(5 + grade_index * 3 + rng.uniform(0, 3, n_rows), 2)
+    term_months = rng.choice([36, 60], n_rows, p=[0.75, 0.25])
+    monthly_rate = int_rate / 1200
+    instalment = np.round(loan_amount * monthly_rate / (1 - (1 + monthly_rate) ** -term_months), 2)
+    total_payment = np.round(instalment * rng.uniform(0, term_months), 2)
+    total_rec_int = np.round(np.minimum(total_payment, total_payment * monthly_rate * term_months / 2), 2)
+    total_rec_prncp = np.round(np.minimum(total_payment - total_rec_int, loan_amount), 2)
+    out_prncp = np.round(loan_amount - total_rec_prncp, 2)
+    issue_index = rng.integers(48, len(months) - 1, n_rows)
+
+    df = pd.DataFrame({
+        'id': np.arange(start_id, start_id + n_rows),
+        'member_id': rng.integers(1, 10_000_000, n_rows),
+        'loan_amount': loan_amount,
+        'funded_amount': loan_amount.astype(float),
+        'funded_amount_inv': np.round(loan_amount * rng.uniform(0.9, 1, n_rows), 2),
+        'term': np.char.add(term_months.astype(str), ' months'),
+        'int_rate': int_rate,
+        'instalment': instalment,
+        'grade': grades,
+        'sub_grade': np.char.add(grades, rng.integers(1, 6, n_rows).astype(str)),
+        'employment_length': rng.choice(['< 1 year', '1 year'] + [f'{i} years' for i in range(2, 10)]
+                                        + ['10+ years'], n_rows),
+        'home_ownership': rng.choice(['MORTGAGE', 'RENT', 'OWN', 'OTHER'], n_rows, p=[0.5, 0.4, 0.09, 0.01]),
+        'annual_inc': np.round(rng.lognormal(11, 0.5, n_rows), 2),
+        'verification_status': rng.choice(['Verified', 'Source Verified', 'Not Verified'], n_rows),
+        'issue_date': months[issue_index],
+        'loan_status': rng.choice(['Fully Paid', 'Current', 'Charged Off', 'Late (31-120 days)',
+                                   'In Grace Period', 'Late (16-30 days)', 'Default'],
+                                  n_rows, p=[0.5, 0.35, 0.1, 0.02, 0.015, 0.01, 0.005]),
+        'payment_plan': rng.choice(['n', 'y'], n_rows, p=[0.999, 0.001]),
+        'purpose': rng.choice(['debt_consolidation', 'credit_card', 'home_improvement', 'other',
+                               'major_purchase', 'small_business', 'car', 'medical'], n_rows),
+        'dti': np.round(rng.uniform(0, 35, n_rows), 2),
+        'delinq_2yrs': rng.poisson(0.25, n_rows),
+        'earliest_credit_line': months[rng.integers(0, 48, n_rows)],
+        'inq_last_6mths': rng.poisson(0.8, n_rows),
+        'mths_since_last_delinq': rng.integers(0, 150, n_rows).astype(float),
+        'mths_since_last_record': rng.integers(0, 120, n_rows).astype(float),
+        'open_accounts': rng.integers(1, 40, n_rows),
+        'total_accounts': rng.integers(40, 80, n_rows),
+        'out_prncp': out_prncp,
+        'out_prncp_inv': out_prncp,
+        'total_payment': total_payment,
+        'total_payment_inv': total_payment,
+        'total_rec_prncp': total_rec_prncp,
+        'total_rec_int': total_rec_int,
+        'total_rec_late_fee': np.round(rng.exponential(0.5, n_rows) * (rng.random(n_rows) < 0.03), 2),
+        'recoveries': np.round(rng.exponential(500, n_rows) * (rng.random(n_rows) < 0.05), 2),
+        'collection_recovery_fee': np.round(rng.exponential(50, n_rows) * (rng.random(n_rows) < 0.05), 2),
+        'last_payment_date': months[issue_index + 1],
+        'last_payment_amount': np.round(instalment * rng.uniform(0.5, 1.5, n_rows), 2),
+        'next_payment_date': months[issue_index + 1],
+        'last_credit_pull_date': months[issue_index + 1],
+        'collections_12_mths_ex_med': (rng.random(n_rows) < 0.01).astype(float),
+        'mths_since_last_major_derog': rng.integers(0, 160, n_rows).astype(float),
+        'policy_code': np.ones(n_rows, dtype=int),
+        'application_type': 'INDIVIDUAL'
+    }, columns=LOAN_PAYMENTS_COLUMNS)
+
+    for col, percentage in NULL_PERCENTAGES.items():
+        df[col] = df[col].where(rng.random(n_rows) >= percentage / 100)
+    return df
+
+
+def is_local_database(url):
+    '''
+    This function checks whether a SQLAlchemy URL points at a local database:
+    a SQLite database or a server on localhost.
+
+    Parameters:
+    ----------
+    url: str or sqlalchemy.engine.URL
+        The URL to check.
+
+    Returns:
+    -------
+    returns True if the database is local, otherwise False.
+    '''
+
+    url = make_url(url)
+    return url.get_backend_name() == 'sqlite' or url.host in LOCAL_HOSTS
+
+
+def bulk_load_loan_payments(engine, n_rows, batch_size=10_000, seed=None, replace=False):
+    '''
+    This function drops and recreates the 'loan_payments' table and fills it with synthetic
+    data in batches. PostgreSQL databases using the psycopg2 driver are loaded with
+    COPY; other databases and drivers (e.g. SQLite, psycopg 3, pg8000) use executemany
+    inserts, one transaction per batch. To protect the real table, it refuses to run
+    against a database that is not local (see is_local_database) unless replace=True.
+
+    Parameters:
+    ----------
+    engine: sqlalchemy.Engine
+        The engine of the database to load.
+    n_rows: int
+        The total number of rows to load.
+    batch_size: int, default=10_000
+        The number of rows generated and inserted at a time.
+    seed: int, optional
+        Seed for the random number generator, for reproducible data.
+    replace: bool, default=False
+        Allows the table to be replaced on a database that is not local.
+
+    Returns:
+    -------
+    returns the number of rows loaded.
+    '''
+
+    if not replace and not is_local_database(engine.url):
+        raise ValueError(f'Refusing to replace loan_payments on non-local database '
+                         f'{engine.url.render_as_string(hide_password=True)}; pass replace=True to override.')
+
+    metadata = MetaData()
+    table = loan_payments_table(metadata)
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+
+    rng = np.random.default_rng(seed)
+    for start in range(0, n_rows, batch_size):
+        batch = generate_loan_payments(min(batch_size, n_rows - start), start_id=start,
+                                       seed=rng.integers(2 ** 32))
+        if engine.dialect.driver == 'psycopg2':
+            buffer = io.StringIO()
+            batch.to_csv(buffer, header=False, index=False)
+            buffer.seek(0)
+            raw_connection = engine.raw_connection()
+            try:
+                with raw_connection.cursor() as cursor:
+                    cursor.copy_expert(f'COPY loan_payments ({", ".join(LOAN_PAYMENTS_COLUMNS)}) '
+                                       'FROM STDIN WITH (FORMAT csv)', buffer)
+                raw_connection.commit()
+            finally:
+                raw_connection.close()
+        else:
+            records = batch.astype(object).where(batch.notna(), None).to_dict('records')
+            with engine.begin() as connection:
+                connection.execute(table.insert(), records)
+    return n_rows
+
+
+class LocalDatabaseConnector(RDSDatabaseConnector):
+    '''
+    A stand-in for RDSDatabaseConnector that connects to a local database instead of
+    the AWS RDS, so extraction can be tested and benchmarked offline.
+
+    Methods:
+    -------
+    database_url()
+        returns the SQLAlchemy URL of the local database.
+
+    load_synthetic_data(n_rows, batch_size, seed, replace)
+        fills the local database with synthetic 'loan_payments' data.
+    '''
+
+
+    def __init__(self, url='sqlite:///loan_payments.db'):
+        '''
+        initialises LocalDatabaseConnector with the URL of the local database.
+
+        Parameters:
+        ----------
+        url: str, default='sqlite:///loan_payments.db'
+            a SQLAlchemy URL, e.g. a SQLite file or a local PostgreSQL server.
+        '''
+
+        super().__init__({})
+        self.url = url
+
+
+    def database_url(self):
+        '''
+        This method returns the SQLAlchemy URL of the local database.
+        '''
+
+        return self.url
+
+
+    def load_synthetic_data(self, n_rows=50_000, batch_size=10_000, seed=None, replace=False):
+        '''
+        This method fills the local database with synthetic 'loan_payments' data,
+        initialising the engine first if needed. See bulk_load_loan_payments for
+        the parameters.
+
+        Returns:
+        -------
+        returns the number of rows loaded.
+        '''
+
+        if self.engine is None:
+            self.initialise_engine()
+        return bulk_load_loan_payments(self.engine, n_rows, batch_size, seed, replace)
+
+
+if __name__ == '__main__':
+    connector = LocalDatabaseConnector()
+    start_time = time.perf_counter()
+    rows_loaded = connector.load_synthetic_data(seed=0)
+    print(f'Loaded {rows_loaded} rows in {time.perf_counter() - start_time:.2f}s')
+
+    start_time = time.perf_counter()
+    loan_payments_df = connector.extract_data()
+    print(f'Extracted {len(loan_payments_df)} rows in {time.perf_counter() - start_time:.2f}s')
+
+    start_time = time.perf_counter()
+    rows_extracted = sum(len(chunk) for chunk in connector.extract_data(chunksize=10_000))
+    print(f'Extracted {rows_extracted} rows in chunks in {time.perf_counter() - start_time:.2f}s')
@@ -0,0 +1,182 @@
+'''
+Imports the libraries needed for computing column quantiles.
+
+Modules:
+--------
+- pandas (pd): used for converting the values added to a sketch.
+- numpy (np): used for the partition based quantile selection and the sketches.
+'''
+
+import pandas as pd
+import numpy as np
+
+
+def array_quantiles(values, qs):
+    '''
+    Returns exact quantiles of a 1-D array, skipping nulls. A single partial sort
+    (np.partition) finds every requested quantile, and the linear interpolation
+    is done the same way as numpy, so the results are identical to pandas.
+
+    Parameters:
+    ----------
+    values: np.ndarray
+        A 1-D float array.
+    qs: list of float
+        The quantiles to return, between 0 and 1.
+
+    Returns:
+    -------
+    np.ndarray
+        The quantile for each q, or NaN for every q if there are no values.
+    '''
+    qs = np.asarray(qs, dtype=float)
+    values = values[~np.isnan(values)]
+    if values.size == 0:
+        return np.full(qs.shape, np.nan)
+    positions = qs * (values.size - 1)
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.minimum(lower + 1, values.size - 1)
+    partitioned = np.partition(values, np.unique(np.concatenate([lower, upper])))
+    below, above, fraction = partitioned[lower], partitioned[upper], positions - lower
+    return np.where(fraction >= 0.5, above - (above - below) * (1 - fraction),
+                    below + (above - below) * fraction)
+
+
+class QuantileSketch:
+    '''
+    A mergeable, fixed-memory sketch for approximate quantiles of a single column.
+    Values are held in levels; when a level fills up it is sorted and every other
+    value is promoted to the next level with double the weight. Use this class when
+    the data arrives in chunks and cannot be held in memory at once.
+
+    Methods:
+    -------
+    update(values)
+        adds an array of values to the sketch.
+
+    merge(other)
+        merges another QuantileSketch into this one.
+
+    quantile(q)
+        returns the approximate quantile(s) for q.
+    '''
+    def __init__(self, k=200, seed=None):
+        '''
+        Parameters:
+        ----------
+        k: int, default=200
+            The number of values held per level. Larger values are more accurate
+            but use more memory.
+        seed: int, optional
+            Seed for the random offset used when compacting a level.
+        '''
+        self.k = k
+        self.count = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+
+    def update(self, values):
+        '''Adds an array of values to the sketch, ignoring any nulls.'''
+        values = pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return self
+        self.count += values.size
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compact()
+        return self
+
+
+    def merge(self, other):
+        '''
+        Merges another QuantileSketch into this one and returns this sketch.
+        Both sketches must have been built with the same k.
+        '''
+        if other.k != self.k:
+            raise ValueError(f'Cannot merge sketches with different k ({self.k} and {other.k}).')
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, values in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], values])
+        self.count += other.count
+        self._compact()
+        return self
+
+
+    def _compact(self):
+        '''Halves every level that holds more than k values into the level above it.'''
+        level = 0
+        while level < len(self.levels):
+            while self.levels[level].size > self.k:
+                values = np.sort(self.levels[level])
+                if values.size % 2:
+                    values, kept = values[:-1], values[-1:]
+                else:
+                    kept = np.empty(0)
+                promoted = values[self._rng.integers(2)::2]
+                self.levels[level] = kept
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+
+    def quantile(self, q):
+        '''
+        Returns the approximate quantile(s) of the values added to the sketch.
+
+        Parameter:
+        ----------
+        q: float or list of float
+            The quantile(s) to return, between 0 and 1.
+
+        Returns:
+        -------
+        float or np.ndarray
+            The quantile for each q, or NaN if the sketch is empty.
+        '''
+        qs = np.atleast_1d(np.asarray(q, dtype=float))
+        if self.count == 0:
+            result = np.full(qs.shape, np.nan)
+        else:
+            values = np.concatenate(self.levels)
+            weights = np.concatenate([np.full(level.size, 2.0 ** i) for i, level in enumerate(self.levels)])
+            order = np.argsort(values, kind='stable')
+            values = values[order]
+            cumulative = np.cumsum(weights[order])
+            positions = qs * (cumulative[-1] - 1)
+            result = np.interp(positions, cumulative - 1, values)
+        return result if np.ndim(q) else float(result[0])
+
+
+def sketch_chunks(chunks, columns=None, k=200, seed=None):
+    '''
+    Builds a QuantileSketch per column from an iterable of DataFrame chunks,
+    e.g. pd.read_csv(..., chunksize=n) or pd.read_sql(..., chunksize=n).
+
+    Parameters:
+    ----------
+    chunks: iterable of pd.DataFrame
+        The chunks of data to sketch.
+    columns: list of str, optional
+        The columns to sketch. If None, the numeric columns of the first chunk are used.
+    k: int, default=200
+        The number of values held per level of each sketch.
+    seed: int, optional
+        Seed for the sketches' random compaction.
+
+    Returns:
+    -------
+    dict
+        Maps each column name to its QuantileSketch.
+    '''
+    sketches = {}
+    for chunk in chunks:
+        if columns is None:
+            columns = list(chunk.select_dtypes(include='number').columns)
+        for col in columns:
+            if col not in sketches:
+                sketches[col] = QuantileSketch(k=k, seed=seed)
+            sketches[col].update(chunk[col])
+    return sketches
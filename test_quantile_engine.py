@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_frame_transform import DataFrameTransform
+from quantile_engine import QuantileSketch, array_quantiles, sketch_chunks
+
+
+@pytest.fixture
+def mixed_df():
+    rng = np.random.default_rng(0)
+    floats = rng.lognormal(size=200)
+    floats[::7] = np.nan
+    return pd.DataFrame({
+        'floats': floats,
+        'ints': rng.integers(0, 50, 200),
+        'nullable': pd.array(np.where(rng.random(200) < 0.1, None, rng.integers(0, 9, 200)), dtype='Int64'),
+        'flags': rng.random(200) < 0.3,
+        'all_nan': np.full(200, np.nan),
+    })
+
+
+def rank_error(sorted_values, estimate, q):
+    return abs(np.searchsorted(sorted_values, estimate) / len(sorted_values) - q)
+
+
+@pytest.mark.parametrize('column', ['floats', 'ints', 'nullable', 'flags', 'all_nan'])
+def test_array_quantiles_median_matches_pandas(mixed_df, column):
+    values = mixed_df[column].to_numpy(dtype=float, na_value=np.nan)
+    expected = mixed_df[column].median()
+    assert np.array_equal(array_quantiles(values, [0.5]), [np.nan if pd.isna(expected) else expected],
+                          equal_nan=True)
+
+
+@pytest.mark.parametrize('column', ['floats', 'ints', 'nullable', 'all_nan'])
+def test_array_quantiles_match_pandas(mixed_df, column):
+    qs = [0, 0.1, 0.25, 0.5, 0.75, 0.9, 1]
+    values = mixed_df[column].to_numpy(dtype=float, na_value=np.nan)
+    expected = mixed_df[column].quantile(qs).to_numpy(dtype=float, na_value=np.nan)
+    assert np.array_equal(array_quantiles(values, qs), expected, equal_nan=True)
+
+
+def test_array_quantiles_of_empty_array_is_nan():
+    assert np.isnan(array_quantiles(np.array([]), [0.25, 0.75])).all()
+
+
+def test_remove_outliers_matches_sequential_filtering():
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({'loan': rng.lognormal(8, 1, 2000), 'fee': rng.exponential(1, 2000) * (rng.random(2000) < 0.2),
+                       'rate': rng.normal(10, 3, 2000)})
+    df.loc[::50, 'rate'] = np.nan
+
+    expected = df.copy()
+    for col in ['loan', 'fee', 'rate']:
+        q1, q3 = expected[col].quantile(0.25), expected[col].quantile(0.75)
+        iqr = q3 - q1
+        expected = expected[(expected[col] >= q1 - 1.5 * iqr) & (expected[col] <= q3 + 1.5 * iqr)]
+
+    result = DataFrameTransform(df.copy()).remove_outliers(['loan', 'fee', 'rate'])
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_remove_outliers_keeps_nonzero_rows_after_zero_rows_removed():
+    df = pd.DataFrame({'loan': [100, 200, 300, 400, 10000, 20000, 150, 250],
+                       'fee': [0, 0, 0, 0, 0, 0, 3, 4.0]})
+    result = DataFrameTransform(df).remove_outliers(['loan', 'fee'])
+    assert result.index.tolist() == [0, 1, 2, 3, 6, 7]
+
+
+def test_sketch_rank_error_after_update():
+    values = np.random.default_rng(2).permutation(100_000).astype(float)
+    sketch = QuantileSketch(seed=0).update(values)
+    for q in [0.01, 0.25, 0.5, 0.75, 0.99]:
+        assert rank_error(np.sort(values), sketch.quantile(q), q) < 0.01
+
+
+def test_sketch_rank_error_after_merge():
+    values = np.random.default_rng(3).lognormal(size=100_000)
+    merged = QuantileSketch(seed=0)
+    for chunk in np.array_split(values, 10):
+        merged.merge(QuantileSketch(seed=1).update(chunk))
+    assert merged.count == values.size
+    for q in [0.01, 0.25, 0.5, 0.75, 0.99]:
+        assert rank_error(np.sort(values), merged.quantile(q), q) < 0.02
+
+
+def test_sketch_of_empty_data_is_nan():
+    assert np.isnan(QuantileSketch().update([np.nan, None]).quantile(0.5))
+
+
+def test_merge_rejects_sketches_with_different_k():
+    with pytest.raises(ValueError):
+        QuantileSketch(k=50).update(range(1000)).merge(QuantileSketch(k=100).update(range(1000, 3000)))
+
+
+def test_sketch_chunks_over_chunked_csv_reader(tmp_path):
+    rng = np.random.default_rng(4)
+    df = pd.DataFrame({'amount': rng.lognormal(size=20_000), 'count': rng.integers(0, 100, 20_000),
+                       'label': 'x'})
+    df.loc[::9, 'amount'] = np.nan
+    path = tmp_path / 'data.csv'
+    df.to_csv(path, index=False)
+
+    sketches = sketch_chunks(pd.read_csv(path, chunksize=1_000), seed=0)
+
+    assert set(sketches) == {'amount', 'count'}
+    assert sketches['amount'].count == df['amount'].notna().sum()
+    for col, sketch in sketches.items():
+        values = np.sort(df[col].dropna().to_numpy(dtype=float))
+        for q in [0.25, 0.5, 0.75]:
+            assert rank_error(values, sketch.quantile(q), q) < 0.02